@@ -4,10 +4,13 @@ from enum import Enum
 class EnvVar:
     API_KEY = "JSONBIN_API_KEY"
     BASE_URL = "JSONBIN_BASE_URL"
+    TIMEOUT = "JSONBIN_TIMEOUT"
 
 BASE_URL = os.getenv(EnvVar.BASE_URL, "https://api.jsonbin.io/v3")
 BASE_URL = BASE_URL.strip("/")
 
+TIMEOUT = float(os.getenv(EnvVar.TIMEOUT, "30"))
+
 API_KEY = os.getenv(EnvVar.API_KEY)
 # if not API_KEY:
 #     raise RuntimeError("'JSONBIN_API_KEY' environment variable is not set")
@@ -20,6 +23,7 @@ class HeaderKey(str, Enum):
     COLLECTION_SORT_ORDER = "X-Sort-Order"
     
     SCHEMA_DOC_ID = "X-Schema-Doc-Id"
+    SCHEMA_DOC_NAME = "X-Schema-Doc-Name"
     
     DOC_PRIVATE = "X-Bin-Private"
     DOC_NAME = "X-Bin-Name"
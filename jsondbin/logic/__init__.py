@@ -1,6 +1,7 @@
-from ..config import API_KEY, BASE_URL
+from ..config import API_KEY, BASE_URL, TIMEOUT
 from .document import DocumentClient
 from .collection import CollectionClient
+from .schema import SchemaClient
 
 
 class JsonDBin(CollectionClient):
@@ -19,6 +20,14 @@ class JsonDBin(CollectionClient):
         collection_name: str = None,
         auto_create: bool = False,
         base_url: str = BASE_URL,
+        schema_doc_id: str = None,
+        timeout: float = TIMEOUT,
+        hedge_reads: bool = True,
+        prefetch: str | list = None,
+        prefetch_ttl: float = 300,
+        prefetch_workers: int = 8,
+        prefetch_max_tracked: int = 1000,
+        prefetch_export_path: str = None,
     ):
         """
         Initialize the JsonDBin with the provided API key, collection name, auto_create flag, and base URL.
@@ -28,6 +37,14 @@ class JsonDBin(CollectionClient):
             collection_name (str): The name of the collection to work with. If None, all the documents will set to `"uncategorized"` collection.
             auto_create (bool): Flag indicating whether to automatically create the collection if it does not exist.
             base_url (str): The base URL for API requests.
+            schema_doc_id (str): The ID of the schema document attached to the collection. Documents are validated against it before being sent.
+            timeout (float): The timeout of each request in seconds. `None` to wait forever.
+            hedge_reads (bool): Flag indicating whether to send a duplicate GET request when the first one is slower than the observed p95 latency.
+            prefetch (str | list): A manifest of documents to fetch in the background right away and serve to later `get_document` calls. Either a path to a JSON file or a list of document IDs or `{"id", "json_path", "version"}` dicts.
+            prefetch_ttl (float): Seconds during which prefetched documents are served. `None` to serve them until they are updated or deleted.
+            prefetch_workers (int): The maximum number of concurrent prefetch requests.
+            prefetch_max_tracked (int): The maximum number of distinct documents whose reads are recorded for the manifest. `0` disables recording.
+            prefetch_export_path (str): A file the manifest regenerated from the recorded reads is written to on `close()`. Not written if None.
 
         Returns:
             None
@@ -37,6 +54,14 @@ class JsonDBin(CollectionClient):
             base_url=base_url,
             collection_name=collection_name,
             auto_create=auto_create,
+            schema_doc_id=schema_doc_id,
+            timeout=timeout,
+            hedge_reads=hedge_reads,
+            prefetch=prefetch,
+            prefetch_ttl=prefetch_ttl,
+            prefetch_workers=prefetch_workers,
+            prefetch_max_tracked=prefetch_max_tracked,
+            prefetch_export_path=prefetch_export_path,
         )
 
 
@@ -44,4 +69,5 @@ __all__ = [
     "JsonDBin",
     "CollectionClient",
     "DocumentClient",
+    "SchemaClient",
 ]
@@ -1,5 +1,82 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, TimeoutError as FutureTimeoutError, wait
+from typing import Callable, Hashable, Iterable
+
 import requests
-from ..config import BASE_URL, API_KEY, HeaderKey as HK, EnvVar
+from ..config import BASE_URL, API_KEY, TIMEOUT, HeaderKey as HK, EnvVar
+from ..models.error import Error
+from .resilience import CircuitBreaker, LatencyTracker, LazyExecutor
+
+
+class RequestError(Exception):
+    """Raised when the API responds with a non-200 status code"""
+    def __init__(self, error: Error):
+        super().__init__(f"Status Code: {error.code}. Response: {error.message}")
+        self.error = error
+
+    @property
+    def status_code(self) -> int:
+        return self.error.code
+
+
+class CircuitOpenError(RequestError):
+    """Raised without sending the request when the circuit of an endpoint is open"""
+
+
+def to_error(exception: Exception) -> Error:
+    """Convert an exception raised by a request into an `Error`. Code `0` means no response was received"""
+    if isinstance(exception, RequestError):
+        return exception.error
+    return Error(message=str(exception), code=0)
+
+
+def run_concurrently(
+    func: Callable,
+    items: Iterable[Hashable],
+    max_workers: int = 8,
+    on_progress: Callable[[int, Hashable, object], None] = None,
+) -> dict:
+    """
+    Call `func` on every item through a bounded thread pool, without aborting on failures.
+    Repeated items are only processed once. At most `2 * max_workers` calls are in flight,
+    so `items` can be a lazy iterable.
+
+    Parameters:
+        func (Callable): The function to call with each item.
+        items (Iterable[Hashable]): The items to process.
+        max_workers (int): The maximum number of concurrent calls. Defaults to 8.
+        on_progress (Callable, optional): Called as `on_progress(done_count, item, result)` after each item.
+
+    Returns:
+        dict: A mapping of item to the result of `func`, or to an `Error` if the call failed, in input order.
+    """
+    results = {}
+    pending = {}
+    done_count = 0
+
+    def collect(futures):
+        nonlocal done_count
+        for future in futures:
+            item = pending.pop(future)
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                results[item] = to_error(e)
+            done_count += 1
+            if on_progress:
+                on_progress(done_count, item, results[item])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            if item in results:
+                continue
+            results[item] = None  # reserve the slot to keep the input order
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        collect(wait(pending).done)
+    return results
 
 
 class BaseClient:
@@ -9,13 +86,24 @@ class BaseClient:
     
     Base class for all JSONBin clients.
     """
-    def __init__(self, api_key: str = API_KEY, base_url: str = BASE_URL) -> None:
+    MIN_HEDGE_DELAY = 0.05
+    """Lower bound of the delay, in seconds, before a GET request is hedged"""
+
+    def __init__(
+        self,
+        api_key: str = API_KEY,
+        base_url: str = BASE_URL,
+        timeout: float | None = TIMEOUT,
+        hedge_reads: bool = True,
+    ) -> None:
         """
         Initialize the API client with the provided API key and base URL.
         
         Parameters:
             api_key (str): The API key to be used for authentication. Defaults to the value of API_KEY.
             base_url (str): The base URL of the API. Defaults to the value of BASE_URL.
+            timeout (float | None): The timeout of each request in seconds. `None` to wait forever. Defaults to the value of TIMEOUT.
+            hedge_reads (bool): Whether to send a duplicate GET request when the first one is slower than the observed p95 latency.
         
         Returns:
             None
@@ -26,6 +114,72 @@ class BaseClient:
             HK.CONTENT_TYPE: 'application/json',
             HK.API_KEY: self.api_key,
         }
+        self.timeout = timeout
+        self.hedge_reads = hedge_reads
+        self.latency = LatencyTracker()
+        """Observed latencies of successful requests, used to pick the hedging delay"""
+        self.breakers: dict[str, CircuitBreaker] = {}
+        """Circuit breakers by endpoint, e.g. `"GET b"`"""
+        self.executor = LazyExecutor(max_workers=32, thread_name_prefix="jsondbin-hedge")
+        """Thread pool for hedged requests. Started on first use, and can be shared with other clients"""
+
+    def close(self):
+        """Stop the threads used for hedged requests. The client restarts them if it is used again"""
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_breaker(self, method: str, url_path: str) -> CircuitBreaker:
+        """Get the circuit breaker of the endpoint of a request"""
+        endpoint = f"{method.upper()} {url_path.split('/', 1)[0]}"
+        return self.breakers.setdefault(endpoint, CircuitBreaker())
+
+    @staticmethod
+    def is_server_failure(response: requests.Response) -> bool:
+        """Whether a response signals a server-side failure (5xx or 429), which counts against the circuit breaker"""
+        return response.status_code >= 500 or response.status_code == 429
+
+    def _send(self, url: str, method: str, data: dict|list, headers: dict) -> requests.Response:
+        start = time.monotonic()
+        response = requests.request(method, url, headers=headers, json=data, timeout=self.timeout)
+        if 200 <= response.status_code < 300:
+            self.latency.record(time.monotonic() - start)
+        return response
+
+    def _send_hedged(self, *args) -> requests.Response:
+        """
+        Send a request, and send a duplicate if it has not completed after the observed p95 latency.
+        The first successful response wins. Server failures and transport errors only win once every attempt has finished.
+
+        Attempts only go to the thread pool when a worker is idle, so time spent queueing never counts as latency
+        and hedging backs off under load: without an idle worker, the request is sent unhedged on the calling thread.
+        """
+        primary = self.executor.try_submit(self._send, *args)
+        if primary is None:
+            return self._send(*args)
+        delay = max(self.latency.percentile(95), self.MIN_HEDGE_DELAY)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        hedge = self.executor.try_submit(self._send, *args)
+        if hedge is None:
+            return primary.result()
+        pending = {primary, hedge}
+        failed_response = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                if not self.is_server_failure(future.result()):
+                    return future.result()
+                failed_response = failed_response or future.result()
+        return failed_response or primary.result()
     
     def request(self, url_path: str, method: str = 'GET', data: dict|list = None, headers: dict = None) -> dict|list:
         """
@@ -39,12 +193,30 @@ class BaseClient:
         
         Returns:
             dict|list: The JSON response from the request.
+        
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint is open. The request is not sent.
+            RequestError: If the response status code is not 200.
         """
         url = f"{self.base_url}/{url_path}"
         headers = (headers or {}) | self.base_headers
-        response = requests.request(method, url, headers=headers, json=data)
+        breaker = self.get_breaker(method, url_path)
+        if not breaker.allow():
+            raise CircuitOpenError(Error(message=f"Circuit open for '{method} {url}', failing fast", code=503))
+        # the breaker records one outcome per request, however many attempts hedging made
+        try:
+            if self.hedge_reads and method.upper() == "GET":
+                response = self._send_hedged(url, method, data, headers)
+            else:
+                response = self._send(url, method, data, headers)
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        if self.is_server_failure(response):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
         if response.status_code == 200:
             return response.json()
         else:
-            raise Exception(f"Status Code: {response.status_code}. Response: {response.text}")
-        
\ No newline at end of file
+            raise RequestError(Error(message=response.text, code=response.status_code))
@@ -1,10 +1,17 @@
+import asyncio
+import warnings
 from functools import lru_cache
-from itertools import chain
+from itertools import chain, islice
+from typing import Callable, Iterable
 
-from .base import BaseClient, API_KEY, BASE_URL
+from .base import BaseClient, RequestError, API_KEY, BASE_URL, run_concurrently, to_error
 from .document import DocumentClient
-from ..config import HeaderKey as HK
+from .prefetch import Prefetcher
+from .schema import SchemaClient, is_available as schema_validation_available
+from ..config import TIMEOUT, HeaderKey as HK
+from ..models.column import ColumnBuilder, get_path
 from ..models.document import DocumentOfList
+from ..models.error import Error
 from ..models.collection import Collection, CollectionCreated, CollectionSchema
 
 
@@ -21,6 +28,14 @@ class CollectionClient(BaseClient):
         base_url: str = BASE_URL,
         collection_name: str | None = None,
         auto_create: bool = False,
+        schema_doc_id: str | None = None,
+        timeout: float | None = TIMEOUT,
+        hedge_reads: bool = True,
+        prefetch: str | list | None = None,
+        prefetch_ttl: float | None = 300,
+        prefetch_workers: int = 8,
+        prefetch_max_tracked: int = 1000,
+        prefetch_export_path: str | None = None,
     ):
         """
         Initialize the class with the provided collection name and auto-create option.
@@ -30,25 +45,64 @@ class CollectionClient(BaseClient):
             base_url (str): Base URL for the JSONBin API
             collection_name (str | None): Name of the collection. `None` if not passed
             auto_create (bool): Flag to automatically create collection if not found
+            schema_doc_id (str | None): ID of the schema document attached to the collection, used to validate documents before sending them. Looked up from the collection metadata if not passed, in which case validation is skipped when `jsonschema` is not installed
+            timeout (float | None): Timeout of each request in seconds. `None` to wait forever
+            hedge_reads (bool): Flag to send a duplicate GET request when the first one is slower than the observed p95 latency
+            prefetch (str | list | None): Manifest of documents to fetch in the background right away, as a path to a JSON file or a list of entries. See `Prefetcher`
+            prefetch_ttl (float | None): Seconds during which prefetched documents are served. `None` to serve them until invalidated
+            prefetch_workers (int): Maximum number of concurrent prefetch requests
+            prefetch_max_tracked (int): Maximum number of distinct documents whose reads are recorded for the manifest. `0` disables recording
+            prefetch_export_path (str | None): File the manifest regenerated from the recorded reads is written to on `close`. Not written if None
 
         Returns:
             None
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, hedge_reads=hedge_reads)
+        self.document = DocumentClient(api_key=api_key, base_url=base_url, timeout=timeout, hedge_reads=hedge_reads)
+        """DocumentClient instance. Used to manage documents in the collection"""
+        self.document.executor = self.executor
+        # started first, so that prefetching overlaps with the collection lookup
+        self.prefetch = Prefetcher(
+            self.document.get,
+            manifest=prefetch,
+            max_workers=prefetch_workers,
+            ttl=prefetch_ttl,
+            max_tracked=prefetch_max_tracked,
+            export_path=prefetch_export_path,
+        )
+        """Prefetcher instance. Serves prefetched documents and records document reads"""
         self.collection_name = collection_name
         """Name of the collection. `None` if not passed"""
         self.collection_id = self.get_collection_id()
         """ID of the collection. `None` if not found"""
         if collection_name is not None and not self.collection_id and auto_create:
             self.collection_id = self.create(self.collection_name).record
-        self.document = DocumentClient(api_key=api_key, base_url=base_url)
-        """DocumentClient instance. Used to manage documents in the collection"""
+        self.schema = SchemaClient(api_key=api_key, base_url=base_url, timeout=timeout, hedge_reads=hedge_reads)
+        """SchemaClient instance. Used to fetch and validate against schema documents"""
+        self.schema.executor = self.executor
+        self.schema_doc_id = schema_doc_id
+        """ID of the schema document attached to the collection. `None` if not known"""
+        self.schema_required = schema_doc_id is not None
+        """Whether the schema was set explicitly. Validation of an auto-detected schema is skipped if `jsonschema` is not installed"""
+        if schema_doc_id is None and self.get_collection() is not None:
+            self.schema_doc_id = self.get_collection().schema_doc_id
+        self._warned_schema_skipped = False
+
+    def close(self):
+        """Write the regenerated prefetch manifest, if configured, and stop the threads used for hedged requests"""
+        self.prefetch.close()
+        super().close()
+
+    @lru_cache
+    def get_collection(self):
+        """Cached method to get the collection. `None` if not found"""
+        return ([x for x in self.get_all() if x.name == self.collection_name] or [None])[0]
 
     @lru_cache
     def get_collection_id(self):
         """Cached method to get the collection ID"""
-        _id = ([x.id for x in self.get_all() if x.name == self.collection_name] or [None])[0]
-        return _id
+        collection = self.get_collection()
+        return collection.id if collection else None
 
     def get_all(self):
         """Get all collections"""
@@ -87,7 +141,62 @@ class CollectionClient(BaseClient):
         self.collection_name = resp.name
         return resp
     
-    def create_document(self, doc: dict, name: str = None, private: bool = True):
+    def _should_validate(self) -> bool:
+        """Whether documents are validated locally. Warns once when an auto-detected schema can't be enforced"""
+        if self.schema_doc_id is None:
+            return False
+        if self.schema_required or schema_validation_available():
+            return True
+        if not self._warned_schema_skipped:
+            self._warned_schema_skipped = True
+            warnings.warn(
+                f"Collection '{self.collection_name}' has schema '{self.schema_doc_id}' attached, but 'jsonschema' is not "
+                "installed, so documents are not validated locally. Install it with `pip install jsondbin[schema]`",
+                RuntimeWarning,
+            )
+        return False
+
+    def refresh_schema(self):
+        """Forget the cached schema, so the next validation fetches it again"""
+        self.schema.clear_cache()
+
+    def validate_document(self, doc: dict):
+        """
+        Validate a document against the schema attached to the collection.
+        Does nothing if no schema is attached.
+
+        Parameters:
+            doc (dict): The dictionary data for the document.
+
+        Returns:
+            None
+
+        Raises:
+            Exception: If the document does not match the schema.
+        """
+        if not self._should_validate():
+            return
+        error = self.schema.validate(self.schema_doc_id, doc)
+        if error is not None:
+            raise Exception(f"Document does not match schema '{self.schema_doc_id}': {error}")
+
+    def validate_documents(self, docs: list[dict], max_workers: int = None):
+        """
+        Validate a batch of documents against the schema attached to the collection.
+        Large batches are validated in a process pool.
+
+        Parameters:
+            docs (list[dict]): The documents to validate.
+            max_workers (int, optional): Number of worker processes for large batches.
+
+        Returns:
+            list[Error | None]: One entry per document, `None` for valid documents.
+        """
+        if not self._should_validate():
+            return [None] * len(docs)
+        return self.schema.validate_many(self.schema_doc_id, docs, max_workers=max_workers)
+
+    def create_document(self, doc: dict, name: str = None, private: bool = True, validate: bool = True):
         """
         Create a document using the provided dictionary data.
 
@@ -95,13 +204,39 @@ class CollectionClient(BaseClient):
             doc (dict): The dictionary data for the document.
             name (str): The name of the document (default is None).
             private (bool): A flag indicating if the document is private (default is True).
+            validate (bool): A flag indicating if the document should be validated against the attached schema before sending (default is True).
 
         Returns:
             Document: The created document.
         """
+        if validate:
+            self.validate_document(doc)
         return self.document.create(doc, collection_id=self.collection_id, name=name, private=private)
+
+    def create_documents(self, docs: list[dict], private: bool = True, validate: bool = True):
+        """
+        Create multiple documents. All documents are validated against the attached
+        schema before any of them is sent, so an invalid batch fails without side effects.
+
+        Parameters:
+            docs (list[dict]): The documents to create.
+            private (bool): A flag indicating if the documents are private (default is True).
+            validate (bool): A flag indicating if the documents should be validated before sending (default is True).
+
+        Returns:
+            list[Document]: The created documents.
+
+        Raises:
+            Exception: If any document does not match the schema.
+        """
+        if validate:
+            errors = {i: e for i, e in enumerate(self.validate_documents(docs)) if e is not None}
+            if errors:
+                details = "; ".join(f"#{i}: {e}" for i, e in list(errors.items())[:10])
+                raise Exception(f"{len(errors)} of {len(docs)} documents do not match schema '{self.schema_doc_id}': {details}")
+        return [self.create_document(doc, private=private, validate=False) for doc in docs]
     
-    def update_document(self, doc_id: str, doc: dict, add_version: bool = True):
+    def update_document(self, doc_id: str, doc: dict, add_version: bool = True, validate: bool = True):
         """
         Update a document with the given ID using the provided dictionary.
         
@@ -109,10 +244,14 @@ class CollectionClient(BaseClient):
             doc_id (str): The ID of the document to update.
             doc (dict): The dictionary containing the updated document data.
             add_version (bool, optional): Flag indicating whether to add this for versioning. Defaults to True.
+            validate (bool, optional): Flag indicating whether to validate against the attached schema before sending. Defaults to True.
         
         Returns:
             Document: The updated document.
         """
+        if validate:
+            self.validate_document(doc)
+        self.prefetch.invalidate(doc_id)
         return self.document.update(doc_id, doc, add_version=add_version)
     
     def get_document(self, doc_id: str, json_path: str = None, version: str = "latest"):
@@ -127,22 +266,84 @@ class CollectionClient(BaseClient):
         Returns:
             Document: The retrieved document based on the parameters.
         """
+        prefetched = self.prefetch.get(doc_id, json_path=json_path, version=version)
+        if prefetched is not None:
+            return prefetched
         return self.document.get(doc_id, json_path=json_path, version=version)
 
-    def get_documents(
+    def get_documents_by_ids(
+        self,
+        doc_ids: list[str],
+        json_path: str = None,
+        version: str = "latest",
+        max_workers: int = 16,
+    ):
+        """
+        Retrieves multiple documents concurrently. Repeated IDs are fetched only once,
+        and a failure is returned in place of its document instead of aborting the batch.
+
+        Parameters:
+            doc_ids (list[str]): The IDs of the documents to retrieve.
+            json_path (str, optional): The optional JSON path within the documents. Defaults to None.
+            version (str): The version of the documents to retrieve. Defaults to "latest".
+            max_workers (int): The maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            list[Document | Error]: The documents, or the error that occurred for each of them, in the order of `doc_ids`.
+        """
+        fetched = run_concurrently(
+            lambda doc_id: self.get_document(doc_id, json_path=json_path, version=version),
+            doc_ids,
+            max_workers=max_workers,
+        )
+        return [fetched[doc_id] for doc_id in doc_ids]
+
+    async def aget_documents_by_ids(
+        self,
+        doc_ids: list[str],
+        json_path: str = None,
+        version: str = "latest",
+        max_concurrency: int = 16,
+    ):
+        """
+        Async variant of `get_documents_by_ids`. Requests run in the default executor of the event loop.
+
+        Parameters:
+            doc_ids (list[str]): The IDs of the documents to retrieve.
+            json_path (str, optional): The optional JSON path within the documents. Defaults to None.
+            version (str): The version of the documents to retrieve. Defaults to "latest".
+            max_concurrency (int): The maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            list[Document | Error]: The documents, or the error that occurred for each of them, in the order of `doc_ids`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(doc_id: str):
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self.get_document, doc_id, json_path=json_path, version=version)
+                except Exception as e:
+                    return to_error(e)
+
+        unique_ids = list(dict.fromkeys(doc_ids))
+        fetched = dict(zip(unique_ids, await asyncio.gather(*map(fetch, unique_ids))))
+        return [fetched[doc_id] for doc_id in doc_ids]
+
+    def list_documents(
         self,
         last_doc_id: str = None,
         descending: bool = True,
     ):
         """
-        Get a list of `10` documents from the specified collection.
+        Get the metadata of `10` documents from the specified collection, without fetching their records.
 
         Parameters:
-            last_doc_id (str): The last document ID to start retrieving documents from.
-            descending (bool): Flag to determine the order of documents retrieval.
+            last_doc_id (str): The last document ID to start listing documents from.
+            descending (bool): Flag to determine the order of documents listing.
 
         Returns:
-            generator[Document]: A generator that yields individual documents retrieved.
+            list[DocumentOfList]: The metadata of the listed documents.
         """
         collection_id = self.collection_id if self.collection_id else "uncategorized"
         url_path = f"c/{collection_id}/bins"
@@ -150,7 +351,44 @@ class CollectionClient(BaseClient):
             url_path += f"/{last_doc_id}"
         headers = {HK.COLLECTION_SORT_ORDER: ("ascending", "descending")[descending]}
         resp = self.request(url_path, headers=headers)
-        return (self.document.get(DocumentOfList(**x).id) for x in resp)
+        return [DocumentOfList(**x) for x in resp]
+
+    def iter_document_list(self, descending: bool = True):
+        """
+        Stream the metadata of all documents in the collection, page by page.
+
+        Parameters:
+            descending (bool): Flag to determine the order of documents listing.
+
+        Yields:
+            DocumentOfList: The metadata of each document.
+        """
+        listed = [None] * 10
+        last_doc_id = None
+        while len(listed) == 10:
+            listed = self.list_documents(last_doc_id=last_doc_id, descending=descending)
+            if not listed:
+                break
+            last_doc_id = listed[-1].id
+            yield from listed
+
+    def get_documents(
+        self,
+        last_doc_id: str = None,
+        descending: bool = True,
+    ):
+        """
+        Get a list of `10` documents from the specified collection.
+
+        Parameters:
+            last_doc_id (str): The last document ID to start retrieving documents from.
+            descending (bool): Flag to determine the order of documents retrieval.
+
+        Returns:
+            generator[Document]: A generator that yields individual documents retrieved.
+        """
+        listed = self.list_documents(last_doc_id=last_doc_id, descending=descending)
+        return (self.document.get(x.id) for x in listed)
 
     def get_pages(self, descending: bool = True):
         """
@@ -185,6 +423,75 @@ class CollectionClient(BaseClient):
             list[Document]: A list of all documents.
         """
         return list(chain(*self.get_pages(descending=descending)))
+
+    def iter_column_batches(
+        self,
+        fields: list[str],
+        batch_size: int = 1000,
+        descending: bool = True,
+        max_workers: int = 16,
+    ):
+        """
+        Scan the collection and yield the selected fields of the documents in columnar batches.
+        Documents are fetched concurrently, flattened as they arrive and then dropped, so only the columns are kept in memory.
+        The type of a column carries over to the next batch, but can be promoted within it (e.g. from int to float).
+
+        Parameters:
+            fields (list[str]): Dotted paths into the document records, e.g. `"user.age"` or `"items.0.price"`.
+            batch_size (int): The number of documents per batch. Defaults to 1000.
+            descending (bool): A flag to specify the order of documents.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            generator[dict[str, Column]]: A column per field for each batch. Numeric and boolean fields are typed arrays, with a null mask.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        return self._iter_column_batches(fields, batch_size=batch_size, descending=descending, max_workers=max_workers)
+
+    def _iter_records(self, descending: bool, max_workers: int):
+        """Stream the records of the collection, fetching up to `4 * max_workers` documents at a time concurrently"""
+        listing = (x.id for x in self.iter_document_list(descending=descending))
+        while chunk := list(islice(listing, 4 * max_workers)):
+            for doc in self.get_documents_by_ids(chunk, max_workers=max_workers):
+                if isinstance(doc, Error):
+                    raise RequestError(doc)
+                yield doc.record
+
+    def _iter_column_batches(self, fields: list[str], batch_size: int | None, descending: bool, max_workers: int):
+        """Generator behind `iter_column_batches`. A `batch_size` of None yields a single batch, even for an empty collection"""
+        builders = {f: ColumnBuilder(f) for f in fields}
+        count = 0
+        for record in self._iter_records(descending=descending, max_workers=max_workers):
+            for f, builder in builders.items():
+                builder.append(get_path(record, f))
+            count += 1
+            if count == batch_size:
+                yield {f: builder.build() for f, builder in builders.items()}
+                count = 0
+        if count or batch_size is None:
+            yield {f: builder.build() for f, builder in builders.items()}
+
+    def to_columns(self, fields: list[str], descending: bool = True, numpy: bool = False, max_workers: int = 16):
+        """
+        Scan the whole collection into columns of the selected fields.
+
+        Parameters:
+            fields (list[str]): Dotted paths into the document records, e.g. `"user.age"` or `"items.0.price"`.
+            descending (bool): A flag to specify the order of documents.
+            numpy (bool): A flag to return `(values, mask)` pairs of NumPy arrays instead of `Column`s.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            dict[str, Column] | dict[str, tuple[numpy.ndarray, numpy.ndarray]]: A column per field.
+        """
+        columns = next(self._iter_column_batches(fields, batch_size=None, descending=descending, max_workers=max_workers))
+        if numpy:
+            return {f: column.to_numpy() for f, column in columns.items()}
+        return columns
     
     def delete_document(self, doc_id: str):
         """
@@ -196,8 +503,73 @@ class CollectionClient(BaseClient):
         Returns:
             None
         """
+        self.prefetch.invalidate(doc_id)
         self.document.delete(doc_id)
 
+    def delete_documents(
+        self,
+        doc_ids: Iterable[str],
+        max_workers: int = 8,
+        on_progress: Callable[[int, str, object], None] = None,
+    ):
+        """
+        Deletes the documents with the given IDs concurrently.
+        Failures do not abort the batch, and documents that are already gone count as deleted,
+        so a failed or interrupted run can simply be repeated with the same IDs.
+
+        Parameters:
+            doc_ids (Iterable[str]): The IDs of the documents to be deleted. Can be a lazy iterable.
+            max_workers (int): The maximum number of concurrent DELETE requests. Defaults to 8.
+            on_progress (Callable, optional): Called as `on_progress(done_count, doc_id, error)` after each deletion.
+
+        Returns:
+            dict[str, Error | None]: A mapping of document ID to `None` if deleted, or the `Error` that occurred.
+        """
+        def delete(doc_id: str):
+            self.prefetch.invalidate(doc_id)
+            try:
+                self.document.delete(doc_id)
+            except RequestError as e:
+                if e.status_code != 404:
+                    raise
+
+        return run_concurrently(delete, doc_ids, max_workers=max_workers, on_progress=on_progress)
+
+    def purge(
+        self,
+        predicate: Callable[[DocumentOfList], bool] = None,
+        max_workers: int = 8,
+        on_progress: Callable[[int, str, object], None] = None,
+        uncategorized: bool = False,
+    ):
+        """
+        Deletes all documents of the collection, or only those matching `predicate`.
+        Documents are selected from the metadata-only listing, so their records are never fetched.
+        The listing is completed before deleting, as deleting a page's last document would break the pagination cursor.
+        Purging is restartable: running it again only sees the documents that are left.
+
+        Parameters:
+            predicate (Callable[[DocumentOfList], bool], optional): Selects the documents to delete. Deletes all documents if None.
+            max_workers (int): The maximum number of concurrent DELETE requests. Defaults to 8.
+            on_progress (Callable, optional): Called as `on_progress(done_count, doc_id, error)` after each deletion.
+            uncategorized (bool): Flag to purge the bins that are not in any collection. Required when the client has no collection.
+
+        Returns:
+            dict[str, Error | None]: A mapping of document ID to `None` if deleted, or the `Error` that occurred.
+
+        Raises:
+            Exception: If the collection is not created yet and `uncategorized` is not set, or if `uncategorized` is set on a client with a collection.
+        """
+        if self.collection_id is None and not uncategorized:
+            raise Exception(
+                "You need to create a collection before purging it. "
+                "Pass `uncategorized=True` to purge the bins that are not in any collection"
+            )
+        if self.collection_id is not None and uncategorized:
+            raise Exception("`uncategorized=True` can only be used on a client without a collection")
+        doc_ids = [x.id for x in self.iter_document_list() if predicate is None or predicate(x)]
+        return self.delete_documents(doc_ids, max_workers=max_workers, on_progress=on_progress)
+
     def add_schema(self, schema_doc_id: str):
         """
         Adds a schema to the collection.
@@ -218,6 +590,9 @@ class CollectionClient(BaseClient):
             "PUT",
             headers={HK.SCHEMA_DOC_ID: schema_doc_id},
         )
+        self.schema_doc_id = schema_doc_id
+        self.schema_required = True
+        self.schema.clear_cache()
         return CollectionSchema(**resp)
 
     def remove_schema(self):
@@ -236,4 +611,7 @@ class CollectionClient(BaseClient):
             f"c/{self.collection_id}/schemadoc/remove",
             "PUT",
         )
+        self.schema_doc_id = None
+        self.schema_required = False
+        self.schema.clear_cache()
         return CollectionSchema(**resp)
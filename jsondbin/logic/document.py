@@ -1,5 +1,5 @@
 from .base import BaseClient
-from ..config import API_KEY, BASE_URL, HeaderKey as HK
+from ..config import API_KEY, BASE_URL, TIMEOUT, HeaderKey as HK
 from ..models.document import Document
 
 
@@ -10,8 +10,14 @@ class DocumentClient(BaseClient):
     
     Class for managing documents in JSONBin.
     """
-    def __init__(self, api_key: str = API_KEY, base_url: str = BASE_URL):
-        super().__init__(api_key=api_key, base_url=base_url)
+    def __init__(
+        self,
+        api_key: str = API_KEY,
+        base_url: str = BASE_URL,
+        timeout: float | None = TIMEOUT,
+        hedge_reads: bool = True,
+    ):
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, hedge_reads=hedge_reads)
 
     def create(
         self,
@@ -0,0 +1,143 @@
+import copy
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from ..models.document import Document
+
+
+DocumentKey = tuple[str, str | None, str]
+"""`(doc_id, json_path, version)` of a document read"""
+
+
+def load_manifest(manifest: str | Path | list) -> list[DocumentKey]:
+    """
+    Load a prefetch manifest.
+
+    Parameters:
+        manifest (str | Path | list): A path to a JSON file, or a list of entries. Each entry is
+            either a document ID or a dict with an `"id"` and optional `"json_path"` and `"version"`.
+
+    Returns:
+        list[DocumentKey]: The `(doc_id, json_path, version)` keys of the manifest, without duplicates.
+    """
+    if isinstance(manifest, (str, Path)):
+        manifest = json.loads(Path(manifest).read_text())
+    keys = []
+    for entry in manifest:
+        if isinstance(entry, str):
+            entry = {"id": entry}
+        keys.append((entry["id"], entry.get("json_path"), entry.get("version", "latest")))
+    return list(dict.fromkeys(keys))
+
+
+class Prefetcher:
+    """
+    Prefetcher
+    ==========
+
+    Fetches the documents of a manifest in the background and serves them to later reads.
+    It also records which documents are read, so the manifest can be regenerated from real traffic.
+    Only the first `max_tracked` distinct documents read are tracked, which keeps memory bounded
+    while covering the documents read right after startup. If `export_path` is set, the regenerated
+    manifest is written there by `close`.
+    """
+    def __init__(
+        self,
+        fetch: Callable[[str, str | None, str], Document],
+        manifest: str | Path | list | None = None,
+        max_workers: int = 8,
+        ttl: float | None = 300,
+        max_tracked: int = 1000,
+        export_path: str | Path | None = None,
+    ):
+        """
+        Start fetching the documents of the manifest in the background.
+
+        Parameters:
+            fetch (Callable): Called as `fetch(doc_id, json_path, version)` to fetch a document.
+            manifest (str | Path | list | None): The prefetch manifest. See `load_manifest`. Nothing is prefetched if None.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 8.
+            ttl (float | None): Seconds after construction during which prefetched documents are served. `None` to serve them until invalidated.
+            max_tracked (int): The maximum number of distinct documents whose reads are counted. `0` disables read tracking. Defaults to 1000.
+            export_path (str | Path | None): A file the manifest regenerated from the recorded reads is written to on `close`. Not written if None.
+
+        Returns:
+            None
+        """
+        self.accessed = Counter()
+        """Number of reads of each tracked `(doc_id, json_path, version)`"""
+        self.max_tracked = max_tracked
+        """Maximum number of distinct documents in `accessed`. `0` disables read tracking"""
+        self.export_path = export_path
+        """File the regenerated manifest is written to on `close`. Not written if None"""
+        self.expires_at = None if ttl is None else time.monotonic() + ttl
+        self._lock = threading.Lock()
+        self._futures: dict[DocumentKey, Future] = {}
+        if manifest is None:
+            return
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jsondbin-prefetch")
+        for key in load_manifest(manifest):
+            self._futures[key] = executor.submit(fetch, *key)
+        executor.shutdown(wait=False)
+
+    def get(self, doc_id: str, json_path: str = None, version: str = "latest") -> Document | None:
+        """
+        Record a read, and return a copy of the prefetched document if there is one.
+        Waits for the prefetch if it is still in flight.
+
+        Returns:
+            Document | None: The prefetched document, or None if it was not prefetched, has expired, or failed to fetch.
+        """
+        key = (doc_id, json_path, version)
+        with self._lock:
+            if key in self.accessed or len(self.accessed) < self.max_tracked:
+                self.accessed[key] += 1
+            if self.expires_at is not None and time.monotonic() >= self.expires_at:
+                self._futures.clear()
+            future = self._futures.get(key)
+        if future is None or future.exception() is not None:
+            return None
+        return copy.deepcopy(future.result())
+
+    def invalidate(self, doc_id: str):
+        """Drop the prefetched results of a document, e.g. after it is updated or deleted"""
+        with self._lock:
+            for key in [k for k in self._futures if k[0] == doc_id]:
+                self._futures.pop(key, None)
+
+    def export_manifest(self, path: str | Path | None = None, min_reads: int = 1) -> list[dict]:
+        """
+        Generate a manifest from the recorded reads, most read documents first.
+
+        Parameters:
+            path (str | Path | None): A file to write the manifest to as JSON. Not written if None.
+            min_reads (int): The minimum number of reads for a document to be included. Defaults to 1.
+
+        Returns:
+            list[dict]: The manifest entries.
+        """
+        with self._lock:
+            counts = self.accessed.most_common()
+        manifest = []
+        for (doc_id, json_path, version), count in counts:
+            if count < min_reads:
+                continue
+            entry = {"id": doc_id}
+            if json_path:
+                entry["json_path"] = json_path
+            if version != "latest":
+                entry["version"] = version
+            manifest.append(entry)
+        if path is not None:
+            Path(path).write_text(json.dumps(manifest, indent=2))
+        return manifest
+
+    def close(self):
+        """Write the regenerated manifest to `export_path`, if set"""
+        if self.export_path is not None:
+            self.export_manifest(self.export_path)
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class LatencyTracker:
+    """
+    Keeps a sliding window of observed request latencies, used to pick the hedging delay.
+    """
+    def __init__(self, window: int = 200, min_samples: int = 20, default: float = 1.0):
+        """
+        Parameters:
+            window (int): The number of most recent latencies to keep.
+            min_samples (int): The number of samples needed before percentiles are trusted.
+            default (float): The value returned by `percentile` until enough samples are collected.
+        """
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.default = default
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Record the latency of a successful request"""
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, p: float = 95) -> float:
+        """Return the `p`th percentile of the recorded latencies, in seconds"""
+        with self._lock:
+            if len(self.samples) < self.min_samples:
+                return self.default
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests fail fast.
+    Once `reset_timeout` seconds have passed, a single trial request is let through:
+    the circuit closes if it succeeds, and stays open for another `reset_timeout` otherwise.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Parameters:
+            failure_threshold (int): The number of consecutive failures that opens the circuit.
+            reset_timeout (float): The number of seconds the circuit stays open before a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.opened_at = time.monotonic()  # let one trial request through
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LazyExecutor:
+    """
+    A thread pool that is only started on first use, so clients that never hedge don't hold threads.
+    Can be shared between clients, and restarts lazily after `shutdown`.
+    Tracks its busy workers, so callers can avoid queueing work behind them with `try_submit`.
+    """
+    def __init__(self, max_workers: int = 32, thread_name_prefix: str = "jsondbin"):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.busy = 0
+        """Number of submitted calls that have not finished yet"""
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _run(self, fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.busy -= 1
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+            )
+        self.busy += 1
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        with self._lock:
+            return self._submit(fn, *args, **kwargs)
+
+    def try_submit(self, fn, *args, **kwargs) -> Future | None:
+        """Submit a call only if a worker is idle, so it starts right away. Returns None otherwise"""
+        with self._lock:
+            if self.busy >= self.max_workers:
+                return None
+            return self._submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -1 +1,213 @@
-#TODO - Add support for schemas: https://jsonbin.io/api-reference/schema-docs/get-started
\ No newline at end of file
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .base import BaseClient
+from ..config import API_KEY, BASE_URL, TIMEOUT, HeaderKey as HK
+from ..models.document import Document
+from ..models.error import Error
+
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    jsonschema = None
+
+
+def is_available() -> bool:
+    """Whether the optional `jsonschema` dependency is installed"""
+    return jsonschema is not None
+
+
+PARALLEL_VALIDATION_THRESHOLD = 500
+"""Minimum batch size for which validation is spread over a process pool"""
+
+
+@lru_cache(maxsize=32)
+def compile_schema(schema_json: str):
+    """
+    Compile a JSON schema (serialized as a string) into a validator.
+    The compiled validator is cached, so each schema is compiled only once per process.
+
+    Parameters:
+        schema_json (str): The JSON schema serialized with `json.dumps(..., sort_keys=True)`.
+
+    Returns:
+        jsonschema.protocols.Validator: The compiled validator.
+
+    Raises:
+        ImportError: If `jsonschema` is not installed.
+    """
+    if jsonschema is None:
+        raise ImportError("Schema validation requires 'jsonschema'. Install it with `pip install jsondbin[schema]`")
+    schema = json.loads(schema_json)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def validate(schema_json: str, doc) -> Error | None:
+    """
+    Validate a document against a serialized JSON schema.
+
+    Parameters:
+        schema_json (str): The serialized JSON schema.
+        doc (dict | list): The document to validate.
+
+    Returns:
+        Error | None: The most relevant validation error (as ranked by `jsonschema.exceptions.best_match`), or `None` if the document is valid.
+    """
+    validator = compile_schema(schema_json)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(doc))
+    if error is None:
+        return None
+    path = "/".join(str(x) for x in error.absolute_path)
+    return Error(message=f"{path}: {error.message}" if path else error.message, code=400)
+
+
+def _validate_chunk(schema_json: str, docs: list) -> list[Error | None]:
+    return [validate(schema_json, doc) for doc in docs]
+
+
+def validate_many(schema_json: str, docs: list, max_workers: int = None) -> list[Error | None]:
+    """
+    Validate a batch of documents against a serialized JSON schema.
+    Batches larger than `PARALLEL_VALIDATION_THRESHOLD` are validated in a process pool.
+
+    Parameters:
+        schema_json (str): The serialized JSON schema.
+        docs (list): The documents to validate.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        list[Error | None]: One entry per document, `None` for valid documents.
+    """
+    compile_schema(schema_json)  # fail early on a missing dependency or an invalid schema
+    if len(docs) < PARALLEL_VALIDATION_THRESHOLD:
+        return _validate_chunk(schema_json, docs)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(PARALLEL_VALIDATION_THRESHOLD // 4, len(docs) // (max_workers * 4))
+    chunks = [docs[i:i + chunk_size] for i in range(0, len(docs), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_validate_chunk, [schema_json] * len(chunks), chunks)
+        return [error for chunk in results for error in chunk]
+
+
+class SchemaClient(BaseClient):
+    """
+    SchemaClient
+    ============
+
+    Class for managing schema documents in JSONBin.
+    Ref: https://jsonbin.io/api-reference/schema-docs/get-started
+    """
+    def __init__(
+        self,
+        api_key: str = API_KEY,
+        base_url: str = BASE_URL,
+        timeout: float | None = TIMEOUT,
+        hedge_reads: bool = True,
+        cache_ttl: float | None = 300,
+    ):
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, hedge_reads=hedge_reads)
+        self.cache_ttl = cache_ttl
+        """Seconds a fetched schema is used for validation before it is fetched again. `None` to cache it until `clear_cache`"""
+        self._cache: dict[str, tuple[float | None, str]] = {}
+        self._cache_lock = threading.Lock()
+
+    def create(self, schema: dict, name: str = None):
+        """
+        Creates a schema document.
+
+        Parameters:
+            schema (dict): The JSON schema.
+            name (str, optional): The name of the schema document. Defaults to None.
+
+        Returns:
+            Document: The created schema document.
+        """
+        headers = {HK.SCHEMA_DOC_NAME: name} if name else None
+        resp = self.request("s", "POST", data=schema, headers=headers)
+        return Document(**resp)
+
+    def update(self, schema_doc_id: str, schema: dict):
+        """
+        Updates the schema document with the given ID.
+
+        Parameters:
+            schema_doc_id (str): The ID of the schema document.
+            schema (dict): The new JSON schema.
+
+        Returns:
+            Document: The updated schema document.
+        """
+        resp = self.request(f"s/{schema_doc_id}", "PUT", data=schema)
+        self.clear_cache(schema_doc_id)
+        return Document(**resp)
+
+    def get(self, schema_doc_id: str):
+        """
+        Retrieves the schema document with the given ID.
+
+        Parameters:
+            schema_doc_id (str): The ID of the schema document.
+
+        Returns:
+            Document: The schema document. The schema itself is in `record`.
+        """
+        resp = self.request(f"s/{schema_doc_id}")
+        return Document(**resp)
+
+    def get_schema_json(self, schema_doc_id: str) -> str:
+        """Cached method to get the serialized schema of a schema document. Refetched after `cache_ttl` seconds"""
+        now = time.monotonic()
+        with self._cache_lock:
+            expires_at, schema_json = self._cache.get(schema_doc_id, (0, None))
+        if schema_json is not None and (expires_at is None or now < expires_at):
+            return schema_json
+        schema_json = json.dumps(self.get(schema_doc_id).record, sort_keys=True)
+        with self._cache_lock:
+            self._cache[schema_doc_id] = (None if self.cache_ttl is None else now + self.cache_ttl, schema_json)
+        return schema_json
+
+    def clear_cache(self, schema_doc_id: str = None):
+        """
+        Forget cached schemas, so they are fetched again on the next validation.
+
+        Parameters:
+            schema_doc_id (str, optional): The ID of the schema document to forget. Forgets all schemas if None.
+        """
+        with self._cache_lock:
+            if schema_doc_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(schema_doc_id, None)
+
+    def validate(self, schema_doc_id: str, doc) -> Error | None:
+        """
+        Validates a document against the schema document with the given ID.
+
+        Parameters:
+            schema_doc_id (str): The ID of the schema document.
+            doc (dict | list): The document to validate.
+
+        Returns:
+            Error | None: The validation error, or `None` if the document is valid.
+        """
+        return validate(self.get_schema_json(schema_doc_id), doc)
+
+    def validate_many(self, schema_doc_id: str, docs: list, max_workers: int = None) -> list[Error | None]:
+        """
+        Validates a batch of documents against the schema document with the given ID.
+
+        Parameters:
+            schema_doc_id (str): The ID of the schema document.
+            docs (list): The documents to validate.
+            max_workers (int, optional): Number of worker processes for large batches.
+
+        Returns:
+            list[Error | None]: One entry per document, `None` for valid documents.
+        """
+        return validate_many(self.get_schema_json(schema_doc_id), docs, max_workers=max_workers)
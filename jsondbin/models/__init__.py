@@ -1,10 +1,12 @@
 from .collection import Collection
+from .column import Column
 from .document import Document
 from .error import Error
 
 
 __all__ = [
     "Collection",
+    "Column",
     "Document",
     "Error",
 ]
\ No newline at end of file
@@ -33,6 +33,10 @@ class Collection:
     def name(self) -> str:
         return self.collectionMeta.get("name")
     
+    @property
+    def schema_doc_id(self) -> str | None:
+        return self.collectionMeta.get("schemaDocId")
+    
     @classmethod
     def from_created(cls, created: CollectionCreated):
         return cls(
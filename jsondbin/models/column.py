@@ -0,0 +1,141 @@
+from array import array
+from dataclasses import dataclass, field
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+
+_MISSING = object()
+
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+"""Integers above this magnitude can't all be represented exactly as floats"""
+
+_TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+
+
+def get_path(record, path: str):
+    """
+    Get the value at a dotted path (e.g. `"user.address.city"` or `"items.0.price"`) of a record.
+
+    Returns:
+        The value at the path, or `None` if any part of the path is missing.
+    """
+    value = record
+    for key in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(key, _MISSING)
+        elif isinstance(value, list) and key.lstrip("-").isdigit() and -len(value) <= int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+        if value is _MISSING:
+            return None
+    return value
+
+
+@dataclass
+class Column:
+    name: str
+    kind: str
+    """One of `"bool"`, `"int"`, `"float"` or `"object"`"""
+    values: array | list
+    """The values of the column. Null entries hold a placeholder (`0` or `None`)"""
+    mask: array
+    """`1` where the value is null, `0` otherwise"""
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def to_list(self) -> list:
+        """Return the values as a list, with `None` for null entries"""
+        if self.kind == "bool":
+            return [None if m else bool(v) for v, m in zip(self.values, self.mask)]
+        return [None if m else v for v, m in zip(self.values, self.mask)]
+
+    def to_numpy(self):
+        """
+        Return the column as a `(values, mask)` pair of NumPy arrays.
+        Typed columns are converted without copying element by element.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if numpy is None:
+            raise ImportError("'numpy' is required to convert columns to NumPy arrays")
+        mask = numpy.frombuffer(self.mask, dtype=numpy.uint8).astype(bool) if len(self) else numpy.zeros(0, dtype=bool)
+        if self.kind == "object":
+            values = numpy.empty(len(self.values), dtype=object)
+            values[:] = self.values
+        elif not len(self):
+            values = numpy.zeros(0, dtype={"bool": bool, "int": numpy.int64, "float": numpy.float64}[self.kind])
+        else:
+            dtype = {"bool": numpy.int8, "int": numpy.int64, "float": numpy.float64}[self.kind]
+            values = numpy.frombuffer(self.values, dtype=dtype)
+            values = values.astype(bool) if self.kind == "bool" else values.copy()
+        return values, mask
+
+
+@dataclass
+class ColumnBuilder:
+    """
+    Incrementally builds a `Column`. The type of the column is inferred from its values:
+    integers are stored in an `array("q")`, floats in an `array("d")` and booleans in an `array("b")`.
+    An integer column is promoted to float when a float arrives, unless that would lose precision,
+    and any other mix falls back to a list.
+
+    The inferred type is kept by `build`, so consecutive batches start with the type of the previous one.
+    It can still be promoted within a later batch, e.g. to float when the first float value shows up.
+    """
+    name: str
+    kind: str | None = None
+    values: array | list = field(default_factory=list)
+    mask: array = field(default_factory=lambda: array("B"))
+
+    def _promote(self, kind: str):
+        if kind == "float" and any(abs(v) > _MAX_EXACT_FLOAT_INT for v in self.values):
+            kind = "object"
+        if kind == "float":
+            self.values = array("d", self.values)
+        elif kind == "object":
+            values = self.values.tolist() if isinstance(self.values, array) else self.values
+            if self.kind == "bool":
+                values = [bool(x) for x in values]
+            self.values = [None if m else v for v, m in zip(values, self.mask)]
+        self.kind = kind
+
+    def append(self, value):
+        """Append a value to the column. `None` is recorded as null"""
+        if value is None:
+            self.mask.append(1)
+            self.values.append(None if self.kind in (None, "object") else 0)
+            return
+        kind = (
+            "bool" if isinstance(value, bool)
+            else "int" if isinstance(value, int)
+            else "float" if isinstance(value, float)
+            else "object"
+        )
+        if self.kind is None:
+            nulls = len(self.mask)
+            self.kind = kind
+            if kind != "object":
+                self.values = array(_TYPECODES[kind], [0] * nulls)
+        elif kind != self.kind and self.kind != "object" and (self.kind, kind) != ("float", "int"):
+            self._promote("float" if (self.kind, kind) == ("int", "float") else "object")
+        if self.kind == "float" and kind == "int" and abs(value) > _MAX_EXACT_FLOAT_INT:
+            self._promote("object")
+        try:
+            self.values.append(float(value) if self.kind == "float" else value)
+        except OverflowError:
+            self._promote("object")
+            self.values.append(value)
+        self.mask.append(0)
+
+    def build(self) -> Column:
+        """Return the built column and reset the builder for the next batch, keeping the inferred type"""
+        column = Column(name=self.name, kind=self.kind or "object", values=self.values, mask=self.mask)
+        self.values = array(_TYPECODES[self.kind]) if self.kind in _TYPECODES else []
+        self.mask = array("B")
+        return column
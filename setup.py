@@ -10,6 +10,10 @@ setup(
     author_email="balasubhayu99@gmail.com",
     url="https://github.com/subhayu99/jsondbin",
     packages=find_packages(),
+    extras_require={
+        "schema": ["jsonschema"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
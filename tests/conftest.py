@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from jsondbin.logic.base import BaseClient, RequestError
+from jsondbin.models.error import Error
+
+
+class FakeAPI:
+    """
+    In-memory stand-in for the jsonbin.io API, installed in place of `BaseClient.request`.
+    Every call is recorded in `calls` as `(method, url_path)`.
+    """
+    def __init__(self):
+        self.collections = []
+        self.schemas = {}
+        self.bins = {}
+        """Bins by ID, as `(collection_id, record)`"""
+        self.calls = []
+        self.lock = threading.Lock()
+        self.get_delay = 0
+
+    def add_bin(self, bin_id: str, record, collection_id: str = "uncategorized"):
+        self.bins[bin_id] = (collection_id, record)
+
+    def request(self, client, url_path: str, method: str = "GET", data=None, headers=None):
+        with self.lock:
+            self.calls.append((method, url_path))
+        parts = url_path.split("/")
+        if parts == ["c"] and method == "GET":
+            return self.collections
+        if parts[0] == "s" and method == "GET":
+            return self._get_or_404(self.schemas, parts[1])
+        if parts[0] == "c" and parts[2] == "bins":
+            ids = [i for i, (c, _) in self.bins.items() if c == parts[1]]
+            start = ids.index(parts[3]) + 1 if len(parts) > 3 else 0
+            return [
+                {"record": i, "private": True, "snippetMeta": {}, "createdAt": "2024-01-01"}
+                for i in ids[start:start + 10]
+            ]
+        if parts[0] == "b" and method == "GET":
+            if self.get_delay:
+                threading.Event().wait(self.get_delay)
+            _, record = self._get_or_404(self.bins, parts[1])
+            return {"record": record, "metadata": {"id": parts[1]}}
+        if parts[0] == "b" and method == "POST":
+            bin_id = f"bin{len(self.bins)}"
+            self.add_bin(bin_id, data, (headers or {}).get("X-Collection-Id", "uncategorized"))
+            return {"record": data, "metadata": {"id": bin_id}}
+        if parts[0] == "b" and method == "PUT":
+            collection_id, _ = self._get_or_404(self.bins, parts[1])
+            self.bins[parts[1]] = (collection_id, data)
+            return {"record": data, "metadata": {"parentId": parts[1]}}
+        if parts[0] == "b" and method == "DELETE":
+            with self.lock:
+                self._get_or_404(self.bins, parts[1])
+                del self.bins[parts[1]]
+            return {"message": "Bin deleted successfully"}
+        raise AssertionError(f"Unexpected request: {method} {url_path}")
+
+    @staticmethod
+    def _get_or_404(items: dict, key: str):
+        if key not in items:
+            raise RequestError(Error(message="Not found", code=404))
+        return items[key]
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeAPI()
+    monkeypatch.setattr(BaseClient, "request", lambda client, *args, **kwargs: fake.request(client, *args, **kwargs))
+    return fake
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from jsondbin import JsonDBin
+from jsondbin.models.column import ColumnBuilder
+
+
+def build(*values):
+    builder = ColumnBuilder("x")
+    for value in values:
+        builder.append(value)
+    return builder.build()
+
+
+def test_typed_columns_and_null_mask():
+    column = build(None, 1, 2.5, None)
+    assert column.kind == "float"
+    assert column.to_list() == [None, 1.0, 2.5, None]
+    assert list(column.mask) == [1, 0, 0, 1]
+    assert build(True, None).kind == "bool"
+    assert build(1, "a").to_list() == [1, "a"]
+
+
+def test_large_ints_keep_precision():
+    assert build(1.5, 2 ** 70).to_list() == [1.5, 2 ** 70]
+    assert build(1.5, 2 ** 60 + 1).to_list() == [1.5, 2 ** 60 + 1]
+    assert build(2 ** 60 + 1, 1.5).to_list() == [2 ** 60 + 1, 1.5]
+    assert build(1.5, 2 ** 5000).kind == "object"
+
+
+def test_kind_is_kept_across_batches():
+    builder = ColumnBuilder("x")
+    builder.append(1)
+    builder.build()
+    builder.append(None)
+    assert builder.build().kind == "int"
+
+
+@pytest.fixture
+def db(api):
+    api.collections = [{"record": "c1", "collectionMeta": {"name": "people"}}]
+    for i in range(40):
+        api.add_bin(f"p{i}", {"age": i, "address": {"city": None if i % 2 else "X"}}, "c1")
+    return JsonDBin(api_key="key", collection_name="people")
+
+
+def test_column_batches(db):
+    batches = list(db.iter_column_batches(["age", "address.city"], batch_size=15))
+    assert [len(b["age"]) for b in batches] == [15, 15, 10]
+    assert sum(b["address.city"].mask.count(1) for b in batches) == 20
+    with pytest.raises(ValueError):
+        db.iter_column_batches(["age"], batch_size=0)
+
+
+def test_to_columns_fetches_concurrently(api, db):
+    api.get_delay = 0.05
+    start = time.monotonic()
+    columns = db.to_columns(["age"], max_workers=16)
+    assert sorted(columns["age"].to_list()) == list(range(40))
+    assert time.monotonic() - start < 40 * 0.05 / 2
+
+
+def test_to_columns_of_empty_collection(api):
+    api.collections = [{"record": "c1", "collectionMeta": {"name": "empty"}}]
+    columns = JsonDBin(api_key="key", collection_name="empty").to_columns(["age"])
+    assert len(columns["age"]) == 0
@@ -0,0 +1,54 @@
+import pytest
+
+from jsondbin import JsonDBin
+
+
+@pytest.fixture
+def db(api):
+    api.collections = [{"record": "c1", "collectionMeta": {"name": "people"}}]
+    for i in range(25):
+        api.add_bin(f"p{i}", {"i": i}, "c1")
+    for i in range(3):
+        api.add_bin(f"u{i}", {"i": i})
+    return JsonDBin(api_key="key", collection_name="people")
+
+
+def deletes(api):
+    return [path for method, path in api.calls if method == "DELETE"]
+
+
+def test_purge_deletes_only_the_collection(api, db):
+    results = db.purge()
+    assert len(results) == 25 and not any(results.values())
+    assert sorted(api.bins) == ["u0", "u1", "u2"]
+
+
+def test_purge_with_predicate(api, db):
+    db.purge(predicate=lambda meta: meta.id.endswith("1"))
+    assert {"p1", "p11", "p21"}.isdisjoint(api.bins)
+    assert len(deletes(api)) == 3
+
+
+def test_purge_refuses_unknown_collection(api, db):
+    typo = JsonDBin(api_key="key", collection_name="typo")
+    with pytest.raises(Exception, match="create a collection"):
+        typo.purge()
+    with pytest.raises(Exception, match="create a collection"):
+        JsonDBin(api_key="key").purge()
+    assert deletes(api) == []
+
+
+def test_purge_uncategorized_requires_opt_in(api, db):
+    JsonDBin(api_key="key").purge(uncategorized=True)
+    assert sorted(deletes(api)) == ["b/u0", "b/u1", "b/u2"]
+    with pytest.raises(Exception, match="without a collection"):
+        db.purge(uncategorized=True)
+
+
+def test_delete_documents_reports_per_id_outcome(api, db):
+    progress = []
+    results = db.delete_documents(["p0", "missing", "p1", "p0"], on_progress=lambda *args: progress.append(args))
+    assert list(results) == ["p0", "missing", "p1"]
+    assert not any(results.values())  # already gone counts as deleted
+    assert len(progress) == 3
+    assert deletes(api).count("b/p0") == 1
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import pytest
+
+from jsondbin import JsonDBin
+from jsondbin.models import Document, Error
+
+
+@pytest.fixture
+def db(api):
+    for i in range(30):
+        api.add_bin(f"b{i}", {"i": i})
+    return JsonDBin(api_key="key")
+
+
+IDS = ["b3", "missing", "b1", "b3", "b2"]
+
+
+def check(api, results):
+    assert [r.id if isinstance(r, Document) else r for r in results] == [
+        "b3", Error(message="Not found", code=404), "b1", "b3", "b2"
+    ]
+    assert api.calls.count(("GET", "b/b3/latest")) == 1
+
+
+def test_get_documents_by_ids_keeps_order_and_reports_errors(api, db):
+    check(api, db.get_documents_by_ids(IDS))
+
+
+def test_aget_documents_by_ids_keeps_order_and_reports_errors(api, db):
+    check(api, asyncio.run(db.aget_documents_by_ids(IDS)))
+
+
+def test_get_documents_by_ids_is_concurrent(api, db):
+    api.get_delay = 0.05
+    start = time.monotonic()
+    results = db.get_documents_by_ids([f"b{i}" for i in range(30)], max_workers=16)
+    assert [r.record["i"] for r in results] == list(range(30))
+    assert time.monotonic() - start < 30 * 0.05 / 3
@@ -0,0 +1,85 @@
+import json
+import time
+
+import pytest
+
+from jsondbin import JsonDBin
+from jsondbin.logic.prefetch import Prefetcher, load_manifest
+
+
+@pytest.fixture
+def api_with_bins(api):
+    for i in range(5):
+        api.add_bin(f"b{i}", {"i": i})
+    return api
+
+
+def gets(api, doc_id):
+    return api.calls.count(("GET", f"b/{doc_id}/latest"))
+
+
+def test_load_manifest(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(["a", {"id": "b", "json_path": "$.x", "version": "2"}, "a"]))
+    assert load_manifest(path) == [("a", None, "latest"), ("b", "$.x", "2")]
+
+
+def test_prefetched_documents_are_served_as_copies(api_with_bins):
+    db = JsonDBin(api_key="key", prefetch=["b0", "b1"])
+    first = db.get_document("b0")
+    first.record["i"] = "changed"
+    assert db.get_document("b0").record == {"i": 0}
+    assert gets(api_with_bins, "b0") == 1
+
+
+def test_update_invalidates_prefetched_document(api_with_bins):
+    db = JsonDBin(api_key="key", prefetch=["b0"])
+    db.get_document("b0")
+    db.update_document("b0", {"i": 10})
+    assert db.get_document("b0").record == {"i": 10}
+    assert gets(api_with_bins, "b0") == 2
+
+
+def test_prefetched_documents_expire(api_with_bins):
+    db = JsonDBin(api_key="key", prefetch=["b0"], prefetch_ttl=0.05)
+    db.get_document("b0")
+    time.sleep(0.06)
+    db.get_document("b0")
+    assert gets(api_with_bins, "b0") == 2
+
+
+def test_concurrent_reads_are_counted_exactly(api_with_bins):
+    db = JsonDBin(api_key="key")
+    for _ in range(20):
+        db.get_documents_by_ids([f"b{i}" for i in range(5)], max_workers=16)
+    assert sorted(db.prefetch.accessed.values()) == [20] * 5
+
+
+def test_tracking_is_bounded(api_with_bins):
+    db = JsonDBin(api_key="key", prefetch_max_tracked=2)
+    db.get_documents_by_ids([f"b{i}" for i in range(5)])
+    assert len(db.prefetch.accessed) == 2
+    db = JsonDBin(api_key="key", prefetch_max_tracked=0)
+    db.get_document("b0")
+    assert not db.prefetch.accessed
+
+
+def test_manifest_is_written_on_close(api_with_bins, tmp_path):
+    path = tmp_path / "manifest.json"
+    with JsonDBin(api_key="key", prefetch_export_path=str(path)) as db:
+        db.get_document("b1")
+        db.get_document("b1")
+        db.get_document("b2", json_path="$.i")
+    assert json.loads(path.read_text()) == [{"id": "b1"}, {"id": "b2", "json_path": "$.i"}]
+
+
+def test_failed_prefetch_falls_back_to_a_live_read(api_with_bins):
+    calls = []
+
+    def fetch(doc_id, json_path, version):
+        calls.append(doc_id)
+        raise RuntimeError("boom")
+
+    prefetcher = Prefetcher(fetch, ["b0"])
+    assert prefetcher.get("b0") is None
+    assert calls == ["b0"]
@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from jsondbin.logic.base import BaseClient, CircuitOpenError, RequestError
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.text = str(status_code)
+
+    def json(self):
+        return {"status": self.status_code}
+
+
+class FakeTransport:
+    """Replaces `requests.request`. `plan` returns `(delay, status_code)` for the n-th request"""
+    def __init__(self, plan):
+        self.plan = plan
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        with self.lock:
+            n = self.count
+            self.count += 1
+        delay, status = self.plan(n)
+        time.sleep(delay)
+        if status is None:
+            raise requests.ConnectionError("connection refused")
+        return FakeResponse(status)
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    def install(plan):
+        fake = FakeTransport(plan)
+        monkeypatch.setattr(requests, "request", fake)
+        return fake
+    return install
+
+
+def make_client(p95: float = 0.05, **kwargs) -> BaseClient:
+    client = BaseClient(api_key="key", base_url="http://jsonbin.test", **kwargs)
+    for _ in range(client.latency.min_samples):
+        client.latency.record(p95)
+    return client
+
+
+def test_hedge_wins_over_slow_server_failure(transport):
+    fake = transport(lambda n: (0.4, 500) if n == 0 else (0.1, 200))
+    with make_client() as client:
+        assert client.request("b/x") == {"status": 200}
+    assert fake.count == 2
+
+
+def test_server_failure_is_returned_when_every_attempt_fails(transport):
+    transport(lambda n: (0.2, 500))
+    with make_client() as client, pytest.raises(RequestError) as e:
+        client.request("b/x")
+    assert e.value.status_code == 500
+
+
+def test_no_hedging_without_idle_workers(transport):
+    fake = transport(lambda n: (0.1, 200))
+    with make_client(p95=0.01) as client:
+        client.executor.max_workers = 4
+        with ThreadPoolExecutor(max_workers=32) as callers:
+            results = list(callers.map(lambda i: client.request(f"b/{i}"), range(64)))
+    assert all(r == {"status": 200} for r in results)
+    # only requests that got an idle worker may be hedged
+    assert fake.count <= 64 + 4
+
+
+def test_flat_latency_does_not_double_requests(transport):
+    fake = transport(lambda n: (0.1, 200))
+    with make_client(p95=0.1) as client:
+        with ThreadPoolExecutor(max_workers=64) as callers:
+            list(callers.map(lambda i: client.request(f"b/{i}"), range(200)))
+    assert fake.count < 200 * 1.25
+
+
+def test_only_successful_latencies_are_recorded(transport):
+    transport(lambda n: (0, 404))
+    client = BaseClient(api_key="key", base_url="http://jsonbin.test", hedge_reads=False)
+    for _ in range(3):
+        with pytest.raises(RequestError):
+            client.request("b/missing")
+    assert len(client.latency.samples) == 0
+
+
+def test_breaker_counts_one_failure_per_hedged_request(transport):
+    transport(lambda n: (0.1, 503))
+    with make_client(p95=0.01) as client:
+        for _ in range(client.get_breaker("GET", "b").failure_threshold):
+            with pytest.raises(RequestError) as e:
+                client.request("b/x")
+            assert not isinstance(e.value, CircuitOpenError)
+        with pytest.raises(CircuitOpenError):
+            client.request("b/x")
+
+
+def test_breaker_recovers_after_reset_timeout(transport):
+    transport(lambda n: (0, None) if n < 5 else (0, 200))
+    client = BaseClient(api_key="key", base_url="http://jsonbin.test", hedge_reads=False)
+    breaker = client.get_breaker("GET", "b")
+    breaker.reset_timeout = 0.05
+    for _ in range(5):
+        with pytest.raises(requests.ConnectionError):
+            client.request("b/x")
+    with pytest.raises(CircuitOpenError):
+        client.request("b/x")
+    time.sleep(0.06)
+    assert client.request("b/x") == {"status": 200}
+    assert breaker.failures == 0
+
+
+def test_timeout_is_passed_to_requests(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(requests, "request", lambda *args, **kwargs: seen.update(kwargs) or FakeResponse(200))
+    BaseClient(api_key="key", base_url="http://jsonbin.test", timeout=2.5, hedge_reads=False).request("b/x")
+    assert seen["timeout"] == 2.5
@@ -0,0 +1,73 @@
+import warnings
+
+import pytest
+
+from jsondbin import JsonDBin
+from jsondbin.logic import schema
+
+
+SCHEMA = {"type": "object", "properties": {"a": {"type": "integer"}}, "required": ["a"]}
+
+
+@pytest.fixture
+def api_with_schema(api):
+    api.collections = [{"record": "c1", "collectionMeta": {"name": "people", "schemaDocId": "s1"}}]
+    api.schemas["s1"] = {"record": SCHEMA, "metadata": {"id": "s1"}}
+    return api
+
+
+def test_validate_error_and_success():
+    pytest.importorskip("jsonschema")
+    schema_json = schema.json.dumps(SCHEMA, sort_keys=True)
+    assert schema.validate(schema_json, {"a": 1}) is None
+    assert schema.validate(schema_json, {"a": "x"}).code == 400
+
+
+def test_validate_without_jsonschema_raises_install_hint(monkeypatch):
+    monkeypatch.setattr(schema, "jsonschema", None)
+    schema.compile_schema.cache_clear()
+    with pytest.raises(ImportError, match="jsondbin\\[schema\\]"):
+        schema.validate("{}", {})
+
+
+def test_detected_schema_rejects_invalid_document(api_with_schema):
+    pytest.importorskip("jsonschema")
+    db = JsonDBin(api_key="key", collection_name="people")
+    assert db.schema_doc_id == "s1"
+    with pytest.raises(Exception, match="does not match schema"):
+        db.create_document({"a": "x"})
+    assert ("POST", "b") not in api_with_schema.calls
+
+
+def test_detected_schema_is_skipped_without_jsonschema(api_with_schema, monkeypatch):
+    monkeypatch.setattr(schema, "jsonschema", None)
+    db = JsonDBin(api_key="key", collection_name="people")
+    with pytest.warns(RuntimeWarning, match="not validated locally"):
+        db.create_document({"a": "x"})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        db.create_document({"a": "y"})
+    assert api_with_schema.calls.count(("POST", "b")) == 2
+
+
+def test_explicit_schema_requires_jsonschema(api_with_schema, monkeypatch):
+    monkeypatch.setattr(schema, "jsonschema", None)
+    schema.compile_schema.cache_clear()
+    db = JsonDBin(api_key="key", collection_name="people", schema_doc_id="s1")
+    with pytest.raises(ImportError):
+        db.create_document({"a": 1})
+
+
+def test_schema_cache_expires_and_refreshes(api_with_schema):
+    db = JsonDBin(api_key="key", collection_name="people")
+    db.schema.get_schema_json("s1")
+    db.schema.get_schema_json("s1")
+    assert api_with_schema.calls.count(("GET", "s/s1")) == 1
+    db.refresh_schema()
+    db.schema.get_schema_json("s1")
+    assert api_with_schema.calls.count(("GET", "s/s1")) == 2
+    db.schema.cache_ttl = 0
+    db.refresh_schema()
+    db.schema.get_schema_json("s1")
+    db.schema.get_schema_json("s1")
+    assert api_with_schema.calls.count(("GET", "s/s1")) == 4